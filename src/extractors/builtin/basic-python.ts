@@ -100,7 +100,9 @@ export const basicPython: ArchletteExtractor = async (
   );
 
   // Parse files using Python AST parser (with validated paths)
-  const extractions = await parseFiles(validatedPaths, pythonPath);
+  const extractions = await parseFiles(validatedPaths, pythonPath, {
+    cache: inputs.cache,
+  });
 
   // Count successful vs failed parses
   const successful = extractions.filter((e) => !e.parseError).length;
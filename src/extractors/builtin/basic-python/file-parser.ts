@@ -23,12 +23,21 @@ import type {
 
 const log = createLogger({ context: 'PythonFileParser' });
 
+/**
+ * Options for the Python AST parser script
+ */
+export interface ParseOptions {
+  /** Reuse cached parse results for unchanged files (default: true) */
+  cache?: boolean;
+}
+
 /**
  * Parse Python files using Python AST parser script
  */
 export async function parseFiles(
   filePaths: string[],
   pythonPath = 'python',
+  options: ParseOptions = {},
 ): Promise<FileExtraction[]> {
   if (filePaths.length === 0) {
     return [];
@@ -42,7 +51,12 @@ export async function parseFiles(
     const parserScript = path.join(cliDir, 'scripts', 'python-ast-parser.py');
     log.info(`Parsing ${filePaths.length} Python files using ${parserScript}`);
 
-    const output = await runPythonParser(parserScript, filePaths, pythonPath);
+    const parserArgs = options.cache === false ? ['--no-cache'] : [];
+    const output = await runPythonParser(
+      parserScript,
+      [...parserArgs, ...filePaths],
+      pythonPath,
+    );
 
     // Parse JSON output with improved error handling
     let parsed: PythonParserOutput;
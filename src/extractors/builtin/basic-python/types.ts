@@ -8,6 +8,8 @@ export interface ExtractorInputs {
   include?: string[];
   exclude?: string[];
   pythonPath?: string;
+  /** Reuse cached parse results for unchanged files (default: true) */
+  cache?: boolean;
 }
 
 export interface PackageInfo {
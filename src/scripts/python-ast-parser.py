@@ -10,11 +10,76 @@ Parses Python source files and extracts:
 Outputs JSON for consumption by TypeScript extractor.
 """
 
+import argparse
 import ast
+import functools
+import hashlib
+import inspect
 import json
+import math
+import os
 import sys
 import re
-from typing import Any, Dict, List, Optional, TypedDict, cast
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, TypedDict, cast
+
+
+# Below this many files, process pool startup costs more than it saves
+PARALLEL_MIN_FILES = 8
+
+# ProcessPoolExecutor rejects more workers than this on Windows (ValueError)
+_MAX_WINDOWS_WORKERS = 61
+
+# Parse results of unchanged files are reused across runs. The environment
+# variable moves the cache (tests point it at a scratch directory)
+CACHE_DIR = (os.environ.get('ARCHLETTE_PYTHON_CACHE_DIR')
+             or os.path.join(os.path.expanduser('~'), '.archlette', 'cache', 'python-ast'))
+
+# Least recently used cache entries are removed once the cache grows past
+# this size, down to three quarters of it
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# JSON output is machine-read: no whitespace after separators
+_COMPACT_SEPARATORS = (',', ':')
+
+
+# Precompiled regex patterns (compiled once at import, reused for every docstring)
+
+# Docstring style detection in a single scan. The alternation is wrapped in a
+# lookahead so matches never consume text and every position is considered,
+# which keeps the Google > NumPy > Sphinx precedence of separate searches.
+_STYLE_RE = re.compile(
+    r'(?=(?P<google>\n\s*(?:Args|Returns|Yields|Raises|Note|Example|Attributes):\s*\n)'
+    r'|(?P<numpy>\n\s*(?:Parameters|Returns|Yields|Raises|See Also|Notes|Examples)\s*\n\s*-+\s*\n)'
+    r'|(?P<sphinx>:(?:param|type|returns?|rtype|raises?)(?:\s+\w+)?:))'
+)
+
+# Sphinx field lists: one match per line, lastgroup names the field kind
+_SPHINX_FIELD_RE = re.compile(
+    r':(?:param\s+(?P<param_name>\w+):\s*(?P<param>.+)'
+    r'|type\s+(?P<type_name>\w+):\s*(?P<type>.+)'
+    r'|returns?:\s*(?P<returns>.+)'
+    r'|rtype:\s*(?P<rtype>.+)'
+    r'|raises?\s+(?P<raises_name>\w+):\s*(?P<raises>.+))'
+)
+
+_DASHES_RE = re.compile(r'^-+$')
+
+# Section entry indentation: continuation lines are indented past these
+_INDENT4 = ' ' * 4
+_INDENT8 = ' ' * 8
+_ARG_GOOGLE_RE = re.compile(r'(\w+)\s*(?:\(([^)]+)\))?\s*:\s*(.+)')
+_RETURNS_GOOGLE_RE = re.compile(r'(\w+(?:\[.*?\])?)\s*:\s*(.+)', re.DOTALL)
+_RAISES_GOOGLE_RE = re.compile(r'(\w+)\s*:\s*(.+)')
+
+# Module docstring tags: one scan finds every tag, the anchored patterns below
+# then parse each occurrence
+_MODULE_TAGS_RE = re.compile(r'@(module|component|namespace|actor|uses)\b')
+_COMPONENT_TAG_RES = {tag: re.compile(rf'@{tag}\s+(\S+)') for tag in ('module', 'component', 'namespace')}
+# Descriptions run up to the next '@'. A negated class instead of a lazy
+# dot-all capture with lookahead keeps matching linear (no backtracking)
+_ACTOR_RE = re.compile(r'@actor\s+(\S+)\s+\{(Person|System)\}\s*(?:\{(in|out|both)\}\s*)?([^@]*)')
+_USES_RE = re.compile(r'@uses\s+(\S+)\s*([^@]*)')
 
 
 # Type definitions for docstring parsing
@@ -43,6 +108,18 @@ class ParsedDocstring(TypedDict, total=False):
     examples: Optional[str]
 
 
+# Shared result for members without a docstring. Never mutate it: the empty
+# sequences are tuples (serialized as JSON arrays) so accidental appends fail
+_EMPTY_PARSED_DOC = cast(ParsedDocstring, {
+    'summary': None,
+    'description': None,
+    'args': (),
+    'returns': None,
+    'raises': (),
+    'examples': None,
+})
+
+
 class DocstringParser:
     """Parse docstrings in Google, NumPy, and Sphinx styles.
     
@@ -58,8 +135,14 @@ class DocstringParser:
     def parse(self, docstring: Optional[str]) -> ParsedDocstring:
         """Parse a docstring and extract structured information."""
         if not docstring:
+            return _EMPTY_PARSED_DOC
+        
+        # One line without ':' cannot hold a section or field: it is the
+        # summary, which is all _parse_simple would find
+        if '\n' not in docstring and ':' not in docstring:
+            summary = docstring.strip()
             return {
-                'summary': None,
+                'summary': summary if summary and not summary.startswith('@') else None,
                 'description': None,
                 'args': [],
                 'returns': None,
@@ -67,32 +150,42 @@ class DocstringParser:
                 'examples': None,
             }
         
+        # Split once; every style parser works on the same lines
+        lines = docstring.split('\n')
+        
         # Detect style and parse accordingly
-        if self._is_google_style(docstring):
-            return self._parse_google(docstring)
-        elif self._is_numpy_style(docstring):
-            return self._parse_numpy(docstring)
-        elif self._is_sphinx_style(docstring):
-            return self._parse_sphinx(docstring)
+        style = self._detect_style(docstring)
+        if style == 'google':
+            return self._parse_google(lines)
+        elif style == 'numpy':
+            return self._parse_numpy(lines)
+        elif style == 'sphinx':
+            return self._parse_sphinx(lines)
         else:
             # Simple style - just summary and description
-            return self._parse_simple(docstring)
-    
-    def _is_google_style(self, docstring: str) -> bool:
-        """Check if docstring uses Google style."""
-        return bool(re.search(r'\n\s*(Args|Returns|Yields|Raises|Note|Example|Attributes):\s*\n', docstring))
+            return self._parse_simple(lines)
     
-    def _is_numpy_style(self, docstring: str) -> bool:
-        """Check if docstring uses NumPy style."""
-        return bool(re.search(r'\n\s*(Parameters|Returns|Yields|Raises|See Also|Notes|Examples)\s*\n\s*-+\s*\n', docstring))
-    
-    def _is_sphinx_style(self, docstring: str) -> bool:
-        """Check if docstring uses Sphinx/reST style."""
-        return bool(re.search(r':(param|type|returns?|rtype|raises?)(\s+\w+)?:', docstring))
+    def _detect_style(self, docstring: str) -> Optional[str]:
+        """Detect docstring style: 'google', 'numpy', 'sphinx', or None.
+        
+        Google wins over NumPy, which wins over Sphinx, regardless of where
+        in the docstring each marker appears.
+        """
+        # Every marker contains ':' (Google, Sphinx) or a newline plus dashes
+        # (NumPy); plain one-paragraph docstrings skip the regex entirely
+        if ':' not in docstring and ('-' not in docstring or '\n' not in docstring):
+            return None
+        style = None
+        for match in _STYLE_RE.finditer(docstring):
+            found = match.lastgroup
+            if found == 'google':
+                return found
+            if found == 'numpy' or style is None:
+                style = found
+        return style
     
-    def _parse_google(self, docstring: str) -> ParsedDocstring:
+    def _parse_google(self, lines: List[str]) -> ParsedDocstring:
         """Parse Google-style docstring."""
-        lines = docstring.split('\n')
         sections = self._split_sections_google(lines)
         
         result: ParsedDocstring = {
@@ -101,14 +194,14 @@ class DocstringParser:
             'args': [],
             'returns': None,
             'raises': [],
-            'examples': sections.get('Examples') or sections.get('Example'),
+            'examples': self._join_block(sections.get('Examples') or sections.get('Example')),
         }
         
         # Parse Args section
         if 'Args' in sections or 'Arguments' in sections:
-            args_text = sections.get('Args') or sections.get('Arguments')
-            if args_text:
-                result['args'] = self._parse_args_google(args_text)
+            args_lines = sections.get('Args') or sections.get('Arguments')
+            if args_lines:
+                result['args'] = self._parse_args_google(args_lines)
         
         # Parse Returns section
         if 'Returns' in sections:
@@ -120,9 +213,8 @@ class DocstringParser:
         
         return result
     
-    def _parse_numpy(self, docstring: str) -> ParsedDocstring:
+    def _parse_numpy(self, lines: List[str]) -> ParsedDocstring:
         """Parse NumPy-style docstring."""
-        lines = docstring.split('\n')
         sections = self._split_sections_numpy(lines)
         
         result: ParsedDocstring = {
@@ -131,7 +223,7 @@ class DocstringParser:
             'args': [],
             'returns': None,
             'raises': [],
-            'examples': sections.get('Examples'),
+            'examples': self._join_block(sections.get('Examples')),
         }
         
         # Parse Parameters section
@@ -148,10 +240,8 @@ class DocstringParser:
         
         return result
     
-    def _parse_sphinx(self, docstring: str) -> ParsedDocstring:
+    def _parse_sphinx(self, lines: List[str]) -> ParsedDocstring:
         """Parse Sphinx/reST-style docstring."""
-        lines = docstring.split('\n')
-        
         # Extract summary (first line until blank line or field list)
         summary_lines: List[str] = []
         description_lines: List[str] = []
@@ -189,219 +279,188 @@ class DocstringParser:
         }
         
         # Parse field lists
-        param_pattern = r':param\s+(\w+):\s*(.+)'
-        type_pattern = r':type\s+(\w+):\s*(.+)'
-        return_pattern = r':returns?:\s*(.+)'
-        rtype_pattern = r':rtype:\s*(.+)'
-        raises_pattern = r':raises?\s+(\w+):\s*(.+)'
-        
         param_types: Dict[str, str] = {}
         
         for line in lines[i:]:
-            line = line.strip()
+            match = _SPHINX_FIELD_RE.match(line.strip())
+            if not match:
+                continue
+            field = match.lastgroup
             
             # :param name: description
-            param_match = re.match(param_pattern, line)
-            if param_match:
-                name = param_match.group(1)
-                desc = param_match.group(2)
+            if field == 'param':
+                name = match.group('param_name')
                 result['args'].append({
                     'name': name,
                     'type': param_types.get(name),
-                    'description': desc,
+                    'description': match.group('param'),
                 })
-                continue
             
             # :type name: type
-            type_match = re.match(type_pattern, line)
-            if type_match:
-                name = type_match.group(1)
-                param_type = type_match.group(2)
+            elif field == 'type':
+                name = match.group('type_name')
+                param_type = match.group('type')
                 param_types[name] = param_type
                 # Update existing param if already added
                 for arg in result['args']:
                     if arg['name'] == name:
                         arg['type'] = param_type
-                continue
-            
-            # :returns: description
-            return_match = re.match(return_pattern, line)
-            if return_match:
-                if result['returns'] is None:
-                    result['returns'] = {'description': None, 'type': None}
-                returns_info = cast(ReturnInfo, result['returns'])
-                returns_info['description'] = return_match.group(1)
-                continue
             
-            # :rtype: type
-            rtype_match = re.match(rtype_pattern, line)
-            if rtype_match:
+            # :returns: description / :rtype: type
+            elif field == 'returns' or field == 'rtype':
                 if result['returns'] is None:
                     result['returns'] = {'description': None, 'type': None}
                 returns_info = cast(ReturnInfo, result['returns'])
-                returns_info['type'] = rtype_match.group(1)
-                continue
+                if field == 'returns':
+                    returns_info['description'] = match.group('returns')
+                else:
+                    returns_info['type'] = match.group('rtype')
             
             # :raises ExceptionType: description
-            raises_match = re.match(raises_pattern, line)
-            if raises_match:
+            else:
                 result['raises'].append({
-                    'exception': raises_match.group(1),
-                    'description': raises_match.group(2),
+                    'exception': match.group('raises_name'),
+                    'description': match.group('raises'),
                 })
-                continue
         
         return result
     
-    def _parse_simple(self, docstring: str) -> ParsedDocstring:
+    def _parse_simple(self, lines: List[str]) -> ParsedDocstring:
         """Parse simple docstring (just summary and description)."""
-        lines = [line.strip() for line in docstring.split('\n')]
-        
-        # First non-empty line is summary
-        summary = None
-        description_lines = []
-        found_summary = False
-        
-        for line in lines:
-            if not line:
-                continue
-            
-            # Skip @tags for simple parsing
-            if line.startswith('@'):
-                continue
-            
-            if not found_summary:
-                summary = line
-                found_summary = True
-            else:
-                description_lines.append(line)
+        # Non-empty lines, skipping @tags; the first one is the summary
+        content = [line for line in map(str.strip, lines) if line and not line.startswith('@')]
         
         return {
-            'summary': summary,
-            'description': ' '.join(description_lines) if description_lines else None,
+            'summary': content[0] if content else None,
+            'description': ' '.join(content[1:]) if len(content) > 1 else None,
             'args': [],
             'returns': None,
             'raises': [],
             'examples': None,
         }
     
-    def _split_sections_google(self, lines: List[str]) -> Dict[str, str]:
+    def _split_sections_google(self, lines: List[str]) -> Dict[str, Any]:
         """Split Google-style docstring into sections."""
-        sections = {}
-        current_section = 'summary'
-        current_lines: List[str] = []
+        sections: Dict[str, Any] = {}
+        summary_lines: List[str] = []
+        description_lines: List[str] = []
+        current_section: Optional[str] = None
+        current_lines = summary_lines
         
-        section_keywords = ['Args', 'Arguments', 'Returns', 'Yields', 'Raises', 
-                           'Note', 'Notes', 'Example', 'Examples', 'Attributes']
+        section_keywords = {'Args', 'Arguments', 'Returns', 'Yields', 'Raises',
+                            'Note', 'Notes', 'Example', 'Examples', 'Attributes'}
         
         for line in lines:
             stripped = line.strip()
             
             # Check if this is a section header
-            if stripped.rstrip(':') in section_keywords and stripped.endswith(':'):
+            if stripped.endswith(':') and stripped.rstrip(':') in section_keywords:
                 # Save previous section
-                if current_lines:
-                    if current_section == 'summary':
-                        # First paragraph is summary, rest is description
-                        summary_end = 0
-                        for i, line_text in enumerate(current_lines):
-                            if not line_text.strip():
-                                summary_end = i
-                                break
-                        if summary_end == 0:
-                            sections['summary'] = ' '.join(current_lines).strip()
-                        else:
-                            sections['summary'] = ' '.join(current_lines[:summary_end]).strip()
-                            sections['description'] = ' '.join(current_lines[summary_end:]).strip()
-                    else:
-                        sections[current_section] = '\n'.join(current_lines).strip()
-                
-                # Start new section
+                if current_section is not None and current_lines:
+                    sections[current_section] = self._trim_block(current_lines)
                 current_section = stripped.rstrip(':')
                 current_lines = []
-            else:
+            elif (not stripped and current_lines is summary_lines
+                  and summary_lines and summary_lines[0].strip()):
+                # First blank line ends the summary paragraph
+                current_lines = description_lines
                 current_lines.append(line)
-        
-        # Save last section
-        if current_lines:
-            if current_section == 'summary':
-                summary_end = 0
-                for i, line_text in enumerate(current_lines):
-                    if not line_text.strip():
-                        summary_end = i
-                        break
-                if summary_end == 0:
-                    sections['summary'] = ' '.join(current_lines).strip()
-                else:
-                    sections['summary'] = ' '.join(current_lines[:summary_end]).strip()
-                    sections['description'] = ' '.join(current_lines[summary_end:]).strip()
             else:
-                sections[current_section] = '\n'.join(current_lines).strip()
+                current_lines.append(line)
         
+        if current_section is not None and current_lines:
+            sections[current_section] = self._trim_block(current_lines)
+        self._store_intro(sections, summary_lines, description_lines)
         return sections
     
-    def _split_sections_numpy(self, lines: List[str]) -> Dict[str, str]:
+    def _split_sections_numpy(self, lines: List[str]) -> Dict[str, Any]:
         """Split NumPy-style docstring into sections."""
-        sections = {}
-        current_section = 'summary'
-        current_lines: List[str] = []
+        sections: Dict[str, Any] = {}
+        summary_lines: List[str] = []
+        description_lines: List[str] = []
+        current_section: Optional[str] = None
+        current_lines = summary_lines
         
-        section_keywords = ['Parameters', 'Returns', 'Yields', 'Raises', 
-                           'See Also', 'Notes', 'Examples', 'Attributes']
+        section_keywords = {'Parameters', 'Returns', 'Yields', 'Raises',
+                            'See Also', 'Notes', 'Examples', 'Attributes'}
         
         i = 0
-        while i < len(lines):
+        last = len(lines) - 1
+        while i <= last:
             line = lines[i]
             stripped = line.strip()
             
             # Check if this is a section header (followed by dashes)
-            if i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if stripped in section_keywords and re.match(r'^-+$', next_line):
-                    # Save previous section
-                    if current_lines:
-                        if current_section == 'summary':
-                            summary_end = 0
-                            for idx, line_text in enumerate(current_lines):
-                                if not line_text.strip():
-                                    summary_end = idx
-                                    break
-                            if summary_end == 0:
-                                sections['summary'] = ' '.join(current_lines).strip()
-                            else:
-                                sections['summary'] = ' '.join(current_lines[:summary_end]).strip()
-                                sections['description'] = ' '.join(current_lines[summary_end:]).strip()
-                        else:
-                            sections[current_section] = '\n'.join(current_lines).strip()
-                    
-                    # Start new section
-                    current_section = stripped
-                    current_lines = []
-                    i += 2  # Skip header and dashes
-                    continue
+            if i < last and stripped in section_keywords and _DASHES_RE.match(lines[i + 1].strip()):
+                # Save previous section
+                if current_section is not None and current_lines:
+                    sections[current_section] = self._trim_block(current_lines)
+                current_section = stripped
+                current_lines = []
+                i += 2  # Skip header and dashes
+                continue
             
+            if (not stripped and current_lines is summary_lines
+                    and summary_lines and summary_lines[0].strip()):
+                # First blank line ends the summary paragraph
+                current_lines = description_lines
             current_lines.append(line)
             i += 1
         
-        # Save last section
-        if current_lines:
-            if current_section == 'summary':
-                summary_end = 0
-                for idx, line_text in enumerate(current_lines):
-                    if not line_text.strip():
-                        summary_end = idx
-                        break
-                if summary_end == 0:
-                    sections['summary'] = ' '.join(current_lines).strip()
-                else:
-                    sections['summary'] = ' '.join(current_lines[:summary_end]).strip()
-                    sections['description'] = ' '.join(current_lines[summary_end:]).strip()
-            else:
-                sections[current_section] = '\n'.join(current_lines).strip()
-        
+        if current_section is not None and current_lines:
+            sections[current_section] = self._trim_block(current_lines)
+        self._store_intro(sections, summary_lines, description_lines)
         return sections
     
-    def _parse_args_google(self, args_text: str) -> List[ArgInfo]:
+    @staticmethod
+    def _store_intro(sections: Dict[str, Any], summary_lines: List[str],
+                     description_lines: List[str]) -> None:
+        """Store the text before the first section header as summary/description.
+        
+        The summary is the first paragraph; everything from the first blank
+        line on is the description. A leading blank line means there is no
+        split, so the whole intro becomes the summary.
+        """
+        if summary_lines:
+            sections['summary'] = ' '.join(summary_lines).strip()
+        if description_lines:
+            sections['description'] = ' '.join(description_lines).strip()
+    
+    @staticmethod
+    def _trim_block(lines: List[str]) -> List[str]:
+        """Trim a section body like '\\n'.join(lines).strip(), keeping it as lines.
+        
+        Leading/trailing blank lines are dropped and the outer whitespace of
+        the first and last remaining lines is stripped.
+        """
+        start, end = 0, len(lines)
+        while start < end and not lines[start].strip():
+            start += 1
+        while end > start and not lines[end - 1].strip():
+            end -= 1
+        block = lines[start:end]
+        if block:
+            block[0] = block[0].lstrip()
+            block[-1] = block[-1].rstrip()
+        return block
+    
+    @staticmethod
+    def _join_block(lines: Optional[List[str]]) -> Optional[str]:
+        """Join section lines back into text (None if the section is absent)."""
+        return '\n'.join(lines) if lines is not None else None
+    
+    @staticmethod
+    def _join_descriptions(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Join each entry's accumulated description lines (None if there are none).
+        
+        Lines are collected in lists and joined once, instead of growing a
+        string with += per continuation line.
+        """
+        for entry in entries:
+            entry['description'] = ' '.join(entry['description']) or None
+        return entries
+    
+    def _parse_args_google(self, args_lines: List[str]) -> List[ArgInfo]:
         """Parse Args section in Google style.
         
         Format:
@@ -411,15 +470,15 @@ class DocstringParser:
         args = []
         current_arg = None
         
-        for line in args_text.split('\n'):
+        for line in args_lines:
             stripped = line.strip()
             if not stripped:
                 continue
             
             # Check if this is a new arg (starts at beginning of line after indent)
-            if not line.startswith(' ' * 8):  # Not a continuation
+            if not line.startswith(_INDENT8):  # Not a continuation
                 # Match: name (type): description or name: description
-                match = re.match(r'(\w+)\s*(?:\(([^)]+)\))?\s*:\s*(.+)', stripped)
+                match = _ARG_GOOGLE_RE.match(stripped)
                 if match:
                     if current_arg:
                         args.append(current_arg)
@@ -427,18 +486,18 @@ class DocstringParser:
                     current_arg = {
                         'name': match.group(1),
                         'type': match.group(2),
-                        'description': match.group(3),
+                        'description': [match.group(3)],
                     }
             elif current_arg:
                 # Continuation of description
-                current_arg['description'] += ' ' + stripped
+                current_arg['description'].append(stripped)
         
         if current_arg:
             args.append(current_arg)
         
-        return args  # type: ignore[return-value]
+        return self._join_descriptions(args)  # type: ignore[return-value]
     
-    def _parse_args_numpy(self, args_text: str) -> List[ArgInfo]:
+    def _parse_args_numpy(self, args_lines: List[str]) -> List[ArgInfo]:
         """Parse Parameters section in NumPy style.
         
         Format:
@@ -448,13 +507,13 @@ class DocstringParser:
         args = []
         current_arg = None
         
-        for line in args_text.split('\n'):
+        for line in args_lines:
             stripped = line.strip()
             if not stripped:
                 continue
             
             # Check if this is a new parameter (name : type)
-            if ':' in stripped and not line.startswith(' ' * 4):
+            if ':' in stripped and not line.startswith(_INDENT4):
                 if current_arg:
                     args.append(current_arg)
                 
@@ -465,31 +524,28 @@ class DocstringParser:
                 current_arg = {
                     'name': name,
                     'type': param_type,
-                    'description': None,
+                    'description': [],
                 }
             elif current_arg:
                 # Description line
-                if current_arg['description']:
-                    current_arg['description'] += ' ' + stripped
-                else:
-                    current_arg['description'] = stripped
+                current_arg['description'].append(stripped)
         
         if current_arg:
             args.append(current_arg)
         
-        return args  # type: ignore[return-value]
+        return self._join_descriptions(args)  # type: ignore[return-value]
     
-    def _parse_returns_google(self, returns_text: str) -> ReturnInfo:
+    def _parse_returns_google(self, returns_lines: List[str]) -> ReturnInfo:
         """Parse Returns section in Google style.
         
         Format:
             type: description
             description
         """
-        stripped = returns_text.strip()
+        stripped = '\n'.join(returns_lines)
         
         # Try to match: type: description
-        match = re.match(r'(\w+(?:\[.*?\])?)\s*:\s*(.+)', stripped, re.DOTALL)
+        match = _RETURNS_GOOGLE_RE.match(stripped)
         if match:
             return {
                 'type': match.group(1),
@@ -501,14 +557,13 @@ class DocstringParser:
                 'description': stripped,
             }
     
-    def _parse_returns_numpy(self, returns_text: str) -> ReturnInfo:
+    def _parse_returns_numpy(self, lines: List[str]) -> ReturnInfo:
         """Parse Returns section in NumPy style.
         
         Format:
             type
                 description
         """
-        lines = returns_text.strip().split('\n')
         if not lines:
             return {'type': None, 'description': None}
         
@@ -522,250 +577,393 @@ class DocstringParser:
             'description': description if description else None,
         }
     
-    def _parse_raises_google(self, raises_text: str) -> List[RaiseInfo]:
+    def _parse_raises_google(self, raises_lines: List[str]) -> List[RaiseInfo]:
         """Parse Raises section in Google style."""
         raises = []
         current_raise = None
         
-        for line in raises_text.split('\n'):
+        for line in raises_lines:
             stripped = line.strip()
             if not stripped:
                 continue
             
             # Match: ExceptionType: description
-            if not line.startswith(' ' * 8):
-                match = re.match(r'(\w+)\s*:\s*(.+)', stripped)
+            if not line.startswith(_INDENT8):
+                match = _RAISES_GOOGLE_RE.match(stripped)
                 if match:
                     if current_raise:
                         raises.append(current_raise)
                     
                     current_raise = {
                         'exception': match.group(1),
-                        'description': match.group(2),
+                        'description': [match.group(2)],
                     }
             elif current_raise:
-                if current_raise['description']:
-                    current_raise['description'] += ' ' + stripped
-                else:
-                    current_raise['description'] = stripped
+                current_raise['description'].append(stripped)
         
         if current_raise:
             raises.append(current_raise)
         
-        return raises  # type: ignore[return-value]
+        return self._join_descriptions(raises)  # type: ignore[return-value]
     
-    def _parse_raises_numpy(self, raises_text: str) -> List[RaiseInfo]:
+    def _parse_raises_numpy(self, raises_lines: List[str]) -> List[RaiseInfo]:
         """Parse Raises section in NumPy style."""
         raises = []
         current_raise = None
         
-        for line in raises_text.split('\n'):
+        for line in raises_lines:
             stripped = line.strip()
             if not stripped:
                 continue
             
             # Exception type on its own line
-            if not line.startswith(' ' * 4):
+            if not line.startswith(_INDENT4):
                 if current_raise:
                     raises.append(current_raise)
                 
                 current_raise = {
                     'exception': stripped,
-                    'description': None,
+                    'description': [],
                 }
             elif current_raise:
-                if current_raise['description']:
-                    current_raise['description'] += ' ' + stripped
-                else:
-                    current_raise['description'] = stripped
+                current_raise['description'].append(stripped)
         
         if current_raise:
             raises.append(current_raise)
         
-        return raises  # type: ignore[return-value]
+        return self._join_descriptions(raises)  # type: ignore[return-value]
+
+
+_DOCSTRING_PARSER = DocstringParser()
 
 
-def parse_file(file_path: str) -> Dict[str, Any]:
-    """Parse a Python file and extract architecture info."""
+@functools.lru_cache(maxsize=4096)
+def parse_docstring(docstring: Optional[str]) -> ParsedDocstring:
+    """Parse a docstring with the shared parser, memoized by docstring text.
+    
+    Identical docstrings (wrappers, overrides, boilerplate) are parsed once.
+    The returned dict is shared between callers and must not be mutated.
+    """
+    return _DOCSTRING_PARSER.parse(docstring)
+
+
+def parse_file(file_path: str, use_cache: bool = True) -> Dict[str, Any]:
+    """Parse a Python file and extract architecture info.
+    
+    With use_cache, results are reused from the on-disk cache when a file
+    with the same bytes was parsed before; results with a parseError are
+    never cached.
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            source = f.read()
-        
-        tree = ast.parse(source, filename=file_path)
-        
-        return {
-            'filePath': file_path,
-            'component': extract_component(tree),
-            'actors': extract_actors(tree),
-            'relationships': extract_relationships(tree),
-            'classes': extract_classes(tree),
-            'functions': extract_functions(tree),
-            'types': extract_types(tree),
-            'imports': extract_imports(tree),
-        }
+        # Hand ast.parse the raw bytes: it honours PEP 263 cookies and BOMs
+        # itself. The bytes are read, not mapped: a file truncated while
+        # mapped (editors saving in place) kills the process with SIGBUS.
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        return _parse_source(file_path, data, use_cache)
     except SyntaxError as e:
-        return {
-            'filePath': file_path,
-            'component': None,
-            'actors': [],
-            'relationships': [],
-            'classes': [],
-            'functions': [],
-            'types': [],
-            'imports': [],
-            'parseError': f"Syntax error at line {e.lineno}: {e.msg}",
-        }
+        return _error_result(file_path, f"Syntax error at line {e.lineno}: {e.msg}")
     except Exception as e:
-        return {
-            'filePath': file_path,
-            'component': None,
-            'actors': [],
-            'relationships': [],
-            'classes': [],
-            'functions': [],
-            'types': [],
-            'imports': [],
-            'parseError': str(e),
-        }
+        return _error_result(file_path, str(e))
 
 
-def extract_component(tree: ast.Module) -> Optional[Dict[str, Any]]:
-    """Extract @module/@component from module docstring."""
-    docstring = ast.get_docstring(tree)
-    if not docstring:
-        return None
+def _error_result(file_path: str, message: str) -> Dict[str, Any]:
+    """Empty result for a file that could not be parsed."""
+    return {
+        'filePath': file_path,
+        'component': None,
+        'actors': [],
+        'relationships': [],
+        'classes': [],
+        'functions': [],
+        'types': [],
+        'imports': [],
+        'parseError': message,
+    }
+
+
+def _parse_source(file_path: str, source: bytes, use_cache: bool) -> Dict[str, Any]:
+    """Build the result for a file's source bytes, consulting the cache if enabled."""
+    cache_path = _cache_path(source) if use_cache else None
+    if cache_path is not None:
+        cached = _load_cached(cache_path)
+        if cached is not None:
+            cached['filePath'] = file_path
+            return cached
     
-    # Look for @module, @component, or @namespace (in priority order)
-    for tag in ['@module', '@component', '@namespace']:
-        match = re.search(rf'{tag}\s+(\S+)', docstring)
-        if match:
-            name = match.group(1)
-            
-            # Extract description (everything before first @ tag or full docstring)
-            description_match = re.match(r'^(.*?)(?=@)', docstring, re.DOTALL)
-            description = description_match.group(1).strip() if description_match else docstring.strip()
-            
-            return {
-                'name': name,
-                'description': description if description else None,
-            }
+    tree = ast.parse(source, filename=file_path)
+    # Module tags all start with '@': test the raw docstring before paying
+    # for cleaning it
+    module_docstring = ast.get_docstring(tree, clean=False)
+    if module_docstring and '@' in module_docstring:
+        module_docstring = clean_docstring(module_docstring)
+    else:
+        module_docstring = None
     
-    return None
+    visitor = ModuleVisitor()
+    visitor.visit(tree)
+    
+    result = {
+        'filePath': file_path,
+        **extract_module_annotations(module_docstring),
+        'classes': visitor.classes,
+        'functions': visitor.functions,
+        'types': visitor.types,
+        'imports': visitor.imports,
+    }
+    if cache_path is not None:
+        _store_cached(cache_path, result)
+    return result
+
+
+# Statement-list fields of compound statements, in ast field order
+_BLOCK_FIELDS = ('body', 'handlers', 'orelse', 'finalbody', 'cases')
 
 
-def extract_actors(tree: ast.Module) -> List[Dict[str, Any]]:
-    """Extract @actor tags from module docstring.
+class ModuleVisitor(ast.NodeVisitor):
+    """Collect classes, functions, types and imports in a single pass.
     
-    Format: @actor Name {Type} {Direction?} description
-    Examples:
-    - @actor User {Person} {in} End user
-    - @actor Database {System} {out} PostgreSQL database
+    The visitor never recurses into class or function bodies, so nested
+    definitions are not reported as module-level code (class members are
+    handled by extract_methods and extract_properties). Module-level compound
+    statements (if/try/with/...) are descended into for classes only, so
+    conditionally defined classes are still found; functions, types and
+    imports are taken from the module body.
     """
-    docstring = ast.get_docstring(tree)
-    if not docstring:
-        return []
-    
-    actors = []
-    # Pattern: @actor Name {Person|System} {in|out|both}? description
-    pattern = r'@actor\s+(\S+)\s+\{(Person|System)\}\s*(?:\{(in|out|both)\}\s*)?(.*?)(?=@|$)'
-    
-    for match in re.finditer(pattern, docstring, re.DOTALL):
-        name = match.group(1)
-        actor_type = match.group(2)
-        direction = match.group(3) or 'both'
-        description = match.group(4).strip() or None
+    
+    def __init__(self) -> None:
+        self.classes: List[Dict[str, Any]] = []
+        self.functions: List[Dict[str, Any]] = []
+        self.types: List[Dict[str, Any]] = []
+        self.imports: List[Dict[str, Any]] = []
+        self._block_depth = 0
+    
+    # Statement type -> handler; filled on first use of each type
+    _handlers: Dict[type, Callable[['ModuleVisitor', Any], None]] = {}
+    
+    def visit(self, node: ast.AST) -> None:
+        # ast.NodeVisitor.visit formats 'visit_' + class name and looks it
+        # up for every node; resolve each node type once instead
+        node_type = type(node)
+        handler = self._handlers.get(node_type)
+        if handler is None:
+            handler = getattr(ModuleVisitor, 'visit_' + node_type.__name__, ModuleVisitor.generic_visit)
+            self._handlers[node_type] = handler
+        handler(self, node)
+    
+    def visit_Module(self, node: ast.Module) -> None:
+        for statement in node.body:
+            self.visit(statement)
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        # Only the statement lists of compound statements can hold class
+        # definitions; expressions, aliases, withitems etc. are never visited
+        self._block_depth += 1
+        for field in _BLOCK_FIELDS:
+            for child in getattr(node, field, ()):
+                self.visit(child)
+        self._block_depth -= 1
+    
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.classes.append(extract_class(node))
+        if self._block_depth:
+            return
+        class_type = extract_class_type(node)
+        if class_type:
+            self.types.append(class_type)
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        if not self._block_depth:
+            self.functions.append(extract_function(node))
+    
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
+        if not self._block_depth:
+            self.functions.append(extract_function(node))
+    
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        # Type alias assignments (PEP 613: TypeAlias = ...)
+        if not self._block_depth and isinstance(node.target, ast.Name):
+            # Check if annotation is TypeAlias
+            if isinstance(node.annotation, ast.Name) and node.annotation.id == 'TypeAlias':
+                type_alias = {
+                    'name': node.target.id,
+                    'category': 'TypeAlias',
+                    'line': node.lineno,
+                }
+                if node.value:
+                    type_alias['definition'] = unparse_expr(node.value)
+                self.types.append(type_alias)
+    
+    def visit_Assign(self, node: ast.Assign) -> None:
+        if self._block_depth or len(node.targets) != 1 or not isinstance(node.targets[0], ast.Name):
+            return
+        target_name = node.targets[0].id
+        value = node.value
         
-        actors.append({
-            'name': name,
-            'type': actor_type,
-            'direction': direction,
-            'description': description,
-        })
+        # NewType calls: UserId = NewType('UserId', str)
+        if (isinstance(value, ast.Call) and isinstance(value.func, ast.Name)
+                and value.func.id == 'NewType'):
+            self.types.append({
+                'name': target_name,
+                'category': 'NewType',
+                'line': node.lineno,
+                'definition': unparse_expr(value),
+            })
+        
+        # Simple type alias: UserId = str (without TypeAlias annotation)
+        # Heuristic: if it looks like a type (uppercase start) and value is a type expression
+        elif target_name[:1].isupper() and is_type_expression(value):
+            self.types.append({
+                'name': target_name,
+                'category': 'TypeAlias',
+                'line': node.lineno,
+                'definition': unparse_expr(value),
+            })
     
-    return actors
+    def visit_Import(self, node: ast.Import) -> None:
+        if not self._block_depth:
+            self.imports.extend(extract_import(node))
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        if not self._block_depth:
+            self.imports.extend(extract_import(node))
 
 
-def extract_relationships(tree: ast.Module) -> List[Dict[str, Any]]:
-    """Extract @uses tags from module docstring.
+def extract_module_annotations(docstring: Optional[str]) -> Dict[str, Any]:
+    """Extract component, actors and relationships from the module docstring.
     
-    Format: @uses TargetComponent description
+    All tags are located in a single scan of the docstring:
+    - @module/@component/@namespace Name (in priority order)
+    - @actor Name {Person|System} {in|out|both}? description
+      e.g. @actor User {Person} {in} End user
+           @actor Database {System} {out} PostgreSQL database
+    - @uses TargetComponent description
     """
-    docstring = ast.get_docstring(tree)
-    if not docstring:
-        return []
+    component = None
+    actors: List[Dict[str, Any]] = []
+    relationships: List[Dict[str, Any]] = []
+    
+    # Every tag starts with '@': a C-level substring check rules out most
+    # docstrings before the regex engine runs
+    if not docstring or '@' not in docstring:
+        return {'component': component, 'actors': actors, 'relationships': relationships}
     
-    relationships = []
-    # Pattern: @uses TargetName description
-    pattern = r'@uses\s+(\S+)\s*(.*?)(?=@|$)'
+    component_names: Dict[str, str] = {}
+    # End of the last @actor/@uses match, so occurrences are consumed
+    # exactly as separate finditer passes would
+    actors_end = uses_end = 0
     
-    for match in re.finditer(pattern, docstring, re.DOTALL):
-        target = match.group(1)
-        description = match.group(2).strip() or None
+    for tag in _MODULE_TAGS_RE.finditer(docstring):
+        kind = tag.group(1)
+        start = tag.start()
         
-        relationships.append({
-            'target': target,
-            'description': description,
-        })
+        if kind == 'actor':
+            match = _ACTOR_RE.match(docstring, start) if start >= actors_end else None
+            if match:
+                actors_end = match.end()
+                actors.append({
+                    'name': match.group(1),
+                    'type': match.group(2),
+                    'direction': match.group(3) or 'both',
+                    'description': match.group(4).strip() or None,
+                })
+        
+        elif kind == 'uses':
+            match = _USES_RE.match(docstring, start) if start >= uses_end else None
+            if match:
+                uses_end = match.end()
+                relationships.append({
+                    'target': match.group(1),
+                    'description': match.group(2).strip() or None,
+                })
+        
+        elif kind not in component_names:
+            match = _COMPONENT_TAG_RES[kind].match(docstring, start)
+            if match:
+                component_names[kind] = match.group(1)
+    
+    # Look for @module, @component, or @namespace (in priority order)
+    name = (component_names.get('module')
+            or component_names.get('component')
+            or component_names.get('namespace'))
+    if name:
+        # Description is everything before the first @ tag
+        description = docstring[:docstring.index('@')].strip()
+        component = {
+            'name': name,
+            'description': description if description else None,
+        }
     
-    return relationships
+    return {'component': component, 'actors': actors, 'relationships': relationships}
 
 
-def extract_classes(tree: ast.Module) -> List[Dict[str, Any]]:
-    """Extract all class definitions."""
-    classes = []
-    
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            # Only extract top-level classes (not nested classes)
-            if isinstance(getattr(node, 'parent', None), ast.Module) or not hasattr(node, 'parent'):
-                classes.append({
-                    'name': node.name,
-                    'baseClasses': [get_name(base) for base in node.bases],
-                    'decorators': [get_decorator_name(dec) for dec in node.decorator_list],
-                    'decoratorDetails': [get_decorator_info(dec) for dec in node.decorator_list],
-                    'line': node.lineno,
-                    'docstring': ast.get_docstring(node),
-                    'methods': extract_methods(node),
-                    'properties': extract_properties(node),
-                })
+def extract_decorators(node) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """Extract decorator names and details of a class or function.
     
-    return classes
+    Each name equals its detail's 'name', so the expressions are formatted
+    once and the names taken from the details.
+    """
+    details = [get_decorator_info(dec) for dec in node.decorator_list]
+    return [detail['name'] for detail in details], details
+
+
+def extract_class(node: ast.ClassDef) -> Dict[str, Any]:
+    """Extract a class definition."""
+    decorator_names, decorator_details = extract_decorators(node)
+    cls: Dict[str, Any] = {
+        'name': node.name,
+        'baseClasses': [get_name(base) for base in node.bases],
+        'decorators': decorator_names,
+        'decoratorDetails': decorator_details,
+        'line': node.lineno,
+        'methods': extract_methods(node),
+        'properties': extract_properties(node),
+    }
+    docstring = get_docstring(node)
+    if docstring is not None:
+        cls['docstring'] = docstring
+    return cls
 
 
 def extract_methods(class_node: ast.ClassDef) -> List[Dict[str, Any]]:
     """Extract methods from a class."""
     methods = []
-    docstring_parser = DocstringParser()
     
     for node in class_node.body:
         if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
             is_async = isinstance(node, ast.AsyncFunctionDef)
-            is_static = any(get_decorator_name(d) == 'staticmethod' for d in node.decorator_list)
-            is_classmethod = any(get_decorator_name(d) == 'classmethod' for d in node.decorator_list)
-            is_abstract = any(get_decorator_name(d) == 'abstractmethod' for d in node.decorator_list)
+            decorator_names, decorator_details = extract_decorators(node)
             
             # Parse docstring for structured data
-            docstring = ast.get_docstring(node)
-            parsed_doc = docstring_parser.parse(docstring)
+            docstring = get_docstring(node)
+            parsed_doc = parse_docstring(docstring)
             
-            methods.append({
+            method: Dict[str, Any] = {
                 'name': node.name,
-                'isStatic': is_static,
+                'isStatic': 'staticmethod' in decorator_names,
                 'isAsync': is_async,
-                'isClassMethod': is_classmethod,
-                'isAbstract': is_abstract,
-                'decorators': [get_decorator_name(dec) for dec in node.decorator_list],
-                'decoratorDetails': [get_decorator_info(dec) for dec in node.decorator_list],
+                'isClassMethod': 'classmethod' in decorator_names,
+                'isAbstract': 'abstractmethod' in decorator_names,
+                'decorators': decorator_names,
+                'decoratorDetails': decorator_details,
                 'line': node.lineno,
-                'docstring': docstring,
                 'parsedDoc': parsed_doc,
                 'parameters': extract_parameters(node),
-                'returnAnnotation': get_annotation(node.returns) if node.returns else None,
-            })
+            }
+            if docstring is not None:
+                method['docstring'] = docstring
+            if node.returns:
+                method['returnAnnotation'] = get_annotation(node.returns)
+            methods.append(method)
     
     return methods
 
 
+# Decorators that turn a method into a property. cached_property has no
+# setter, so it is reported as read-only
+_PROPERTY_DECORATORS = frozenset(('property', 'cached_property', 'functools.cached_property'))
+
+
 def extract_properties(class_node: ast.ClassDef) -> List[Dict[str, Any]]:
     """Extract class-level properties and @property decorators."""
     properties = []
@@ -776,10 +974,10 @@ def extract_properties(class_node: ast.ClassDef) -> List[Dict[str, Any]]:
     # First pass: Find all @property decorated methods
     for node in class_node.body:
         if isinstance(node, ast.FunctionDef):
-            # Check for @property decorator
-            has_property = any(get_decorator_name(d) == 'property' for d in node.decorator_list)
+            decorator_names = [get_decorator_name(dec) for dec in node.decorator_list]
             
-            if has_property:
+            # Check for @property / @cached_property decorator
+            if not _PROPERTY_DECORATORS.isdisjoint(decorator_names):
                 property_methods[node.name] = {
                     'name': node.name,
                     'type': 'property',
@@ -787,13 +985,12 @@ def extract_properties(class_node: ast.ClassDef) -> List[Dict[str, Any]]:
                     'hasSetter': False,
                     'hasDeleter': False,
                     'line': node.lineno,
-                    'docstring': ast.get_docstring(node),
+                    'docstring': get_docstring(node),
                     'returnAnnotation': get_annotation(node.returns) if node.returns else None,
                 }
             
             # Check for setter (e.g., @name.setter)
-            for dec in node.decorator_list:
-                dec_name = get_decorator_name(dec)
+            for dec_name in decorator_names:
                 if dec_name.endswith('.setter'):
                     prop_name = dec_name.replace('.setter', '')
                     if prop_name in property_methods:
@@ -807,66 +1004,66 @@ def extract_properties(class_node: ast.ClassDef) -> List[Dict[str, Any]]:
     
     # Add property decorators to results
     for prop in property_methods.values():
-        properties.append({
+        prop_info = {
             'name': prop['name'],
             'type': 'property',
-            'annotation': prop['returnAnnotation'],
-            'default': None,
             'line': prop['line'],
-            'docstring': prop['docstring'],
             'isReadonly': prop['hasGetter'] and not prop['hasSetter'],
             'hasGetter': prop['hasGetter'],
             'hasSetter': prop['hasSetter'],
             'hasDeleter': prop['hasDeleter'],
-        })
+        }
+        if prop['returnAnnotation'] is not None:
+            prop_info['annotation'] = prop['returnAnnotation']
+        if prop['docstring'] is not None:
+            prop_info['docstring'] = prop['docstring']
+        properties.append(prop_info)
     
     # Second pass: Extract class variable annotations
     for node in class_node.body:
         if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
             # Skip if this is a property (already handled above)
             if node.target.id not in property_methods:
-                properties.append({
+                class_var = {
                     'name': node.target.id,
                     'type': 'class_variable',
-                    'annotation': get_annotation(node.annotation) if node.annotation else None,
-                    'default': ast.unparse(node.value) if node.value else None,
+                    'annotation': get_annotation(node.annotation),
                     'line': node.lineno,
-                    'docstring': None,
                     'isReadonly': False,  # Can't determine from annotation alone
                     'hasGetter': False,
                     'hasSetter': False,
                     'hasDeleter': False,
-                })
+                }
+                if node.value:
+                    class_var['default'] = unparse_expr(node.value)
+                properties.append(class_var)
     
     return properties
 
 
-def extract_functions(tree: ast.Module) -> List[Dict[str, Any]]:
-    """Extract top-level functions."""
-    functions = []
-    docstring_parser = DocstringParser()
+def extract_function(node) -> Dict[str, Any]:
+    """Extract a top-level function."""
+    is_async = isinstance(node, ast.AsyncFunctionDef)
+    decorator_names, decorator_details = extract_decorators(node)
     
-    for node in tree.body:
-        if isinstance(node, ast.FunctionDef) or isinstance(node, ast.AsyncFunctionDef):
-            is_async = isinstance(node, ast.AsyncFunctionDef)
-            
-            # Parse docstring for structured data
-            docstring = ast.get_docstring(node)
-            parsed_doc = docstring_parser.parse(docstring)
-            
-            functions.append({
-                'name': node.name,
-                'isAsync': is_async,
-                'decorators': [get_decorator_name(dec) for dec in node.decorator_list],
-                'decoratorDetails': [get_decorator_info(dec) for dec in node.decorator_list],
-                'line': node.lineno,
-                'docstring': docstring,
-                'parsedDoc': parsed_doc,
-                'parameters': extract_parameters(node),
-                'returnAnnotation': get_annotation(node.returns) if node.returns else None,
-            })
+    # Parse docstring for structured data
+    docstring = get_docstring(node)
+    parsed_doc = parse_docstring(docstring)
     
-    return functions
+    function: Dict[str, Any] = {
+        'name': node.name,
+        'isAsync': is_async,
+        'decorators': decorator_names,
+        'decoratorDetails': decorator_details,
+        'line': node.lineno,
+        'parsedDoc': parsed_doc,
+        'parameters': extract_parameters(node),
+    }
+    if docstring is not None:
+        function['docstring'] = docstring
+    if node.returns:
+        function['returnAnnotation'] = get_annotation(node.returns)
+    return function
 
 
 def extract_parameters(func_node) -> List[Dict[str, Any]]:
@@ -874,131 +1071,80 @@ def extract_parameters(func_node) -> List[Dict[str, Any]]:
     params = []
     args = func_node.args
     
+    # Defaults belong to the trailing arguments: pad the front with None so
+    # they line up (extra defaults belong to positional-only arguments)
+    default_offset = len(args.args) - len(args.defaults)
+    defaults = [None] * default_offset + args.defaults[max(0, -default_offset):]
+    
     # Regular arguments
-    for i, arg in enumerate(args.args):
+    for arg, default in zip(args.args, defaults):
         # Skip 'self' and 'cls' parameters
         if arg.arg in ('self', 'cls'):
             continue
         
-        # Get default value if exists
-        default = None
-        default_offset = len(args.args) - len(args.defaults)
-        if i >= default_offset:
-            default_value = args.defaults[i - default_offset]
-            default = ast.unparse(default_value)
-        
-        params.append({
-            'name': arg.arg,
-            'annotation': get_annotation(arg.annotation) if arg.annotation else None,
-            'default': default,
-        })
+        param = {'name': arg.arg}
+        if arg.annotation:
+            param['annotation'] = get_annotation(arg.annotation)
+        if default is not None:
+            param['default'] = unparse_expr(default)
+        params.append(param)
     
-    # *args
-    if args.vararg:
-        params.append({
-            'name': f"*{args.vararg.arg}",
-            'annotation': get_annotation(args.vararg.annotation) if args.vararg.annotation else None,
-            'default': None,
-        })
-    
-    # **kwargs
-    if args.kwarg:
-        params.append({
-            'name': f"**{args.kwarg.arg}",
-            'annotation': get_annotation(args.kwarg.annotation) if args.kwarg.annotation else None,
-            'default': None,
-        })
+    # *args and **kwargs
+    for prefix, arg in (('*', args.vararg), ('**', args.kwarg)):
+        if arg:
+            param = {'name': f"{prefix}{arg.arg}"}
+            if arg.annotation:
+                param['annotation'] = get_annotation(arg.annotation)
+            params.append(param)
     
     return params
 
 
-def extract_types(tree: ast.Module) -> List[Dict[str, Any]]:
-    """Extract type definitions (TypeAlias, TypedDict, Protocol, Enum, NewType).
+# Base classes that make a class a type definition
+_TYPE_BASES = frozenset(('TypedDict', 'Protocol', 'Enum', 'IntEnum', 'StrEnum'))
+
+
+def _base_class_name(base: ast.expr) -> Optional[str]:
+    """Unqualified name of a base class: typing.Protocol and Protocol[T] give 'Protocol'."""
+    if isinstance(base, ast.Subscript):
+        base = base.value
+    if isinstance(base, ast.Name):
+        return base.id
+    if isinstance(base, ast.Attribute):
+        return base.attr
+    return None
+
+
+def extract_class_type(node: ast.ClassDef) -> Optional[Dict[str, Any]]:
+    """Extract a class-based type definition (TypedDict, Protocol, Enum).
     
-    Detects:
-    - Type aliases: UserId = str
-    - TypedDict classes
-    - Protocol classes
-    - Enum classes
-    - NewType declarations
+    Returns None for classes that are not type definitions.
     """
-    types = []
+    # Most classes have no bases or none of interest
+    if not node.bases:
+        return None
+    base_names = {_base_class_name(base) for base in node.bases}
+    if base_names.isdisjoint(_TYPE_BASES):
+        return None
     
-    for node in tree.body:
-        # Type alias assignments (PEP 613: TypeAlias = ...)
-        if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
-            # Check if annotation is TypeAlias
-            if isinstance(node.annotation, ast.Name) and node.annotation.id == 'TypeAlias':
-                types.append({
-                    'name': node.target.id,
-                    'category': 'TypeAlias',
-                    'line': node.lineno,
-                    'definition': ast.unparse(node.value) if node.value else None,
-                    'docstring': None,
-                })
-        
-        # Simple type alias: UserId = str (without TypeAlias annotation)
-        elif isinstance(node, ast.Assign):
-            if len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
-                target_name = node.targets[0].id
-                # Heuristic: if it looks like a type (uppercase start) and value is a type expression
-                if target_name[0].isupper() and is_type_expression(node.value):
-                    types.append({
-                        'name': target_name,
-                        'category': 'TypeAlias',
-                        'line': node.lineno,
-                        'definition': ast.unparse(node.value),
-                        'docstring': None,
-                    })
-        
-        # Class-based type definitions
-        elif isinstance(node, ast.ClassDef):
-            base_names = [get_name(base) for base in node.bases]
-            
-            # TypedDict
-            if 'TypedDict' in base_names:
-                types.append({
-                    'name': node.name,
-                    'category': 'TypedDict',
-                    'line': node.lineno,
-                    'definition': extract_typeddict_fields(node),
-                    'docstring': ast.get_docstring(node),
-                })
-            
-            # Protocol
-            elif 'Protocol' in base_names or any('Protocol' in bn for bn in base_names):
-                types.append({
-                    'name': node.name,
-                    'category': 'Protocol',
-                    'line': node.lineno,
-                    'definition': extract_protocol_methods(node),
-                    'docstring': ast.get_docstring(node),
-                })
-            
-            # Enum
-            elif 'Enum' in base_names or 'IntEnum' in base_names or 'StrEnum' in base_names:
-                types.append({
-                    'name': node.name,
-                    'category': 'Enum',
-                    'line': node.lineno,
-                    'definition': extract_enum_members(node),
-                    'docstring': ast.get_docstring(node),
-                })
-        
-        # NewType calls: UserId = NewType('UserId', str)
-        elif isinstance(node, ast.Assign):
-            if len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
-                if isinstance(node.value, ast.Call):
-                    if isinstance(node.value.func, ast.Name) and node.value.func.id == 'NewType':
-                        types.append({
-                            'name': node.targets[0].id,
-                            'category': 'NewType',
-                            'line': node.lineno,
-                            'definition': ast.unparse(node.value),
-                            'docstring': None,
-                        })
+    if 'TypedDict' in base_names:
+        category, definition = 'TypedDict', extract_typeddict_fields(node)
+    elif 'Protocol' in base_names:
+        category, definition = 'Protocol', extract_protocol_methods(node)
+    else:
+        # Enum, IntEnum or StrEnum
+        category, definition = 'Enum', extract_enum_members(node)
     
-    return types
+    type_info = {
+        'name': node.name,
+        'category': category,
+        'line': node.lineno,
+        'definition': definition,
+    }
+    docstring = get_docstring(node)
+    if docstring is not None:
+        type_info['docstring'] = docstring
+    return type_info
 
 
 def is_type_expression(node) -> bool:
@@ -1056,8 +1202,23 @@ def extract_enum_members(class_node: ast.ClassDef) -> str:
     return "{" + ", ".join(members) + "}"
 
 
-def extract_imports(tree: ast.Module) -> List[Dict[str, Any]]:
-    """Extract and categorize import statements.
+# Python 3.13 standard library modules (commonly used ones)
+STDLIB_MODULES = {
+    # Built-in modules
+    'abc', 'asyncio', 'collections', 'contextlib', 'copy', 'csv', 'dataclasses',
+    'datetime', 'decimal', 'enum', 'functools', 'glob', 'hashlib', 'heapq',
+    'io', 'itertools', 'json', 'logging', 'math', 'operator', 'os', 'pathlib',
+    'pickle', 're', 'random', 'shutil', 'socket', 'sqlite3', 'statistics',
+    'string', 'struct', 'subprocess', 'sys', 'tempfile', 'threading', 'time',
+    'traceback', 'typing', 'unittest', 'uuid', 'warnings', 'weakref', 'xml',
+    # Common stdlib packages
+    'typing_extensions', 'concurrent', 'concurrent.futures', 'urllib', 'http',
+    'email', 'html', 'multiprocessing', 'queue', 'secrets', 'selectors',
+}
+
+
+def extract_import(node) -> List[Dict[str, Any]]:
+    """Extract and categorize an import statement.
     
     Categorizes imports as:
     - stdlib: Python standard library modules
@@ -1066,79 +1227,118 @@ def extract_imports(tree: ast.Module) -> List[Dict[str, Any]]:
     """
     imports = []
     
-    # Python 3.13 standard library modules (commonly used ones)
-    stdlib_modules = {
-        # Built-in modules
-        'abc', 'asyncio', 'collections', 'contextlib', 'copy', 'csv', 'dataclasses',
-        'datetime', 'decimal', 'enum', 'functools', 'glob', 'hashlib', 'heapq',
-        'io', 'itertools', 'json', 'logging', 'math', 'operator', 'os', 'pathlib',
-        'pickle', 're', 'random', 'shutil', 'socket', 'sqlite3', 'statistics',
-        'string', 'struct', 'subprocess', 'sys', 'tempfile', 'threading', 'time',
-        'traceback', 'typing', 'unittest', 'uuid', 'warnings', 'weakref', 'xml',
-        # Common stdlib packages
-        'typing_extensions', 'concurrent', 'concurrent.futures', 'urllib', 'http',
-        'email', 'html', 'multiprocessing', 'queue', 'secrets', 'selectors',
-    }
-    
-    for node in tree.body:
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                source = alias.name
-                top_level = source.split('.')[0]
-                
-                # Categorize import
-                if top_level in stdlib_modules:
-                    category = 'stdlib'
-                else:
-                    category = 'third_party'
-                
-                imports.append({
-                    'source': source,
-                    'names': [alias.asname if alias.asname else alias.name],
-                    'isRelative': False,
-                    'level': 0,
-                    'category': category,
-                })
-                
-        elif isinstance(node, ast.ImportFrom):
-            source = node.module or ''
-            names = [alias.asname if alias.asname else alias.name for alias in node.names]
+    if isinstance(node, ast.Import):
+        for alias in node.names:
+            source = alias.name
+            top_level = source.split('.')[0]
             
             # Categorize import
-            if node.level > 0:
-                # Relative imports are always local
-                category = 'local'
-            elif source:
-                top_level = source.split('.')[0]
-                if top_level in stdlib_modules:
-                    category = 'stdlib'
-                else:
-                    # Could be third-party or local - default to third-party
-                    # A more sophisticated approach would check if it's a known package
-                    category = 'third_party'
+            if top_level in STDLIB_MODULES:
+                category = 'stdlib'
             else:
-                # from . import something
-                category = 'local'
+                category = 'third_party'
             
             imports.append({
                 'source': source,
-                'names': names,
-                'isRelative': node.level > 0,
-                'level': node.level,
+                'names': [alias.asname if alias.asname else alias.name],
+                'isRelative': False,
+                'level': 0,
                 'category': category,
             })
+            
+    elif isinstance(node, ast.ImportFrom):
+        source = node.module or ''
+        names = [alias.asname if alias.asname else alias.name for alias in node.names]
+        
+        # Categorize import
+        if node.level > 0:
+            # Relative imports are always local
+            category = 'local'
+        elif source:
+            top_level = source.split('.')[0]
+            if top_level in STDLIB_MODULES:
+                category = 'stdlib'
+            else:
+                # Could be third-party or local - default to third-party
+                # A more sophisticated approach would check if it's a known package
+                category = 'third_party'
+        else:
+            # from . import something
+            category = 'local'
+        
+        imports.append({
+            'source': source,
+            'names': names,
+            'isRelative': node.level > 0,
+            'level': node.level,
+            'category': category,
+        })
     
     return imports
 
 
+# Constant types whose repr() is exactly what ast.unparse() would produce
+# (not float: repr(1e999) is 'inf'; not Ellipsis: repr is 'Ellipsis')
+_REPR_CONSTANT_TYPES = (str, bytes, bool, int, type(None))
+
+
+# Expressions that never need parentheses as a subscript index or element
+_ATOM_TYPES = (ast.Name, ast.Attribute, ast.Subscript, ast.Constant)
+
+
+def unparse_expr(node: ast.expr) -> str:
+    """Source text of an expression; ast.unparse() with fast paths.
+    
+    Names, dotted names, simple literals and subscripts built from them
+    (the bulk of annotations, decorators and defaults) are formatted
+    directly instead of running the full unparser.
+    """
+    node_type = type(node)
+    if node_type is ast.Name:
+        return node.id  # type: ignore[attr-defined]
+    if node_type is ast.Attribute:
+        value = node.value  # type: ignore[attr-defined]
+        if type(value) is ast.Name or type(value) is ast.Attribute:
+            return f"{unparse_expr(value)}.{node.attr}"  # type: ignore[attr-defined]
+    elif node_type is ast.Constant:
+        if node.kind is None and type(node.value) in _REPR_CONSTANT_TYPES:  # type: ignore[attr-defined]
+            return repr(node.value)  # type: ignore[attr-defined]
+    elif node_type is ast.Subscript:
+        value, index = node.value, node.slice  # type: ignore[attr-defined]
+        if type(value) is ast.Name or type(value) is ast.Attribute:
+            if type(index) is ast.Tuple:
+                # One-element tuples need a trailing comma: leave them to unparse
+                elts = index.elts
+                if len(elts) > 1 and all(type(elt) in _ATOM_TYPES for elt in elts):
+                    return f"{unparse_expr(value)}[{', '.join(map(unparse_expr, elts))}]"
+            elif type(index) in _ATOM_TYPES:
+                return f"{unparse_expr(value)}[{unparse_expr(index)}]"
+    return ast.unparse(node)
+
+
+def get_docstring(node: ast.AST) -> Optional[str]:
+    """ast.get_docstring() with a fast path for one-line docstrings.
+    
+    Cleaning a docstring runs inspect.cleandoc, a Python-level loop over its
+    lines. For a single line without tabs cleandoc only strips leading
+    whitespace, so that case is done directly.
+    """
+    docstring = ast.get_docstring(node, clean=False)  # type: ignore[arg-type]
+    if docstring is None:
+        return None
+    return clean_docstring(docstring)
+
+
+def clean_docstring(docstring: str) -> str:
+    """inspect.cleandoc() for a raw docstring, skipping it for single lines."""
+    if '\n' not in docstring and '\t' not in docstring:
+        return docstring.lstrip()
+    return inspect.cleandoc(docstring)
+
+
 def get_name(node) -> str:
     """Get name from various node types."""
-    if isinstance(node, ast.Name):
-        return node.id
-    elif isinstance(node, ast.Attribute):
-        return ast.unparse(node)
-    else:
-        return ast.unparse(node)
+    return unparse_expr(node)
 
 
 def get_decorator_name(node) -> str:
@@ -1148,7 +1348,45 @@ def get_decorator_name(node) -> str:
     elif isinstance(node, ast.Call):
         return get_name(node.func)
     else:
-        return ast.unparse(node)
+        return unparse_expr(node)
+
+
+def _is_json_value(value: Any) -> bool:
+    """Whether json.dumps can encode value as strict JSON.
+    
+    Rules out literals such as bytes, Ellipsis, complex numbers and sets,
+    which make json.dumps raise, and inf/nan, which it writes as tokens
+    JSON.parse rejects.
+    """
+    if value is None or isinstance(value, (str, bool, int)):
+        return True
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, (list, tuple)):
+        return all(_is_json_value(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, (str, int, float, bool)) or key is None
+            for key in value
+        ) and all(_is_json_value(item) for item in value.values())
+    return False
+
+
+def _decorator_arg_value(node: ast.expr, literal_types: Tuple[type, ...]) -> Any:
+    """Literal value of a decorator argument, or its source text.
+    
+    Only literal_types are evaluated, and only values that encode as JSON
+    are kept; anything else falls back to the string representation.
+    """
+    if isinstance(node, literal_types):
+        try:
+            value = ast.literal_eval(node)
+        except Exception:
+            pass
+        else:
+            if _is_json_value(value):
+                return value
+    return unparse_expr(node)
 
 
 def get_decorator_info(node) -> Dict[str, Any]:
@@ -1164,7 +1402,7 @@ def get_decorator_info(node) -> Dict[str, Any]:
         'name': '',
         'args': [],
         'kwargs': {},
-        'raw': ast.unparse(node),
+        'raw': unparse_expr(node),
     }
     
     if isinstance(node, ast.Name):
@@ -1172,61 +1410,279 @@ def get_decorator_info(node) -> Dict[str, Any]:
         result['name'] = node.id
     elif isinstance(node, ast.Attribute):
         # Attribute decorator: @app.route
-        result['name'] = ast.unparse(node)
+        result['name'] = unparse_expr(node)
     elif isinstance(node, ast.Call):
         # Decorator with arguments: @app.route('/path', methods=['GET', 'POST'])
         result['name'] = get_name(node.func)
         
         # Extract positional arguments
         for arg in node.args:
-            try:
-                # Try to get literal value
-                if isinstance(arg, (ast.Constant, ast.Num, ast.Str)):
-                    result['args'].append(ast.literal_eval(arg))
-                else:
-                    # Fall back to string representation
-                    result['args'].append(ast.unparse(arg))
-            except Exception:
-                result['args'].append(ast.unparse(arg))
+            result['args'].append(_decorator_arg_value(arg, (ast.Constant, ast.Num, ast.Str)))
         
         # Extract keyword arguments
         for keyword in node.keywords:
-            try:
-                # Try to get literal value
-                if isinstance(keyword.value, (ast.Constant, ast.Num, ast.Str, ast.List, ast.Dict)):
-                    result['kwargs'][keyword.arg] = ast.literal_eval(keyword.value)
-                else:
-                    # Fall back to string representation
-                    result['kwargs'][keyword.arg] = ast.unparse(keyword.value)
-            except Exception:
-                result['kwargs'][keyword.arg] = ast.unparse(keyword.value)
+            result['kwargs'][keyword.arg] = _decorator_arg_value(
+                keyword.value, (ast.Constant, ast.Num, ast.Str, ast.List, ast.Dict))
     else:
         # Unknown decorator type
-        result['name'] = ast.unparse(node)
+        result['name'] = unparse_expr(node)
     
     return result
 
 
 def get_annotation(node) -> str:
-    """Get type annotation as string."""
+    """Get type annotation as string.
+    
+    Annotations repeat heavily ('str', 'Optional[int]', ...), so formatted
+    ones are interned: results kept in memory (server mode) share one copy
+    of each. Plain names are already interned by the compiler.
+    """
     try:
-        return ast.unparse(node)
+        return sys.intern(unparse_expr(node))
     except Exception:
         return str(node)
 
 
+@functools.lru_cache(maxsize=None)
+def _parser_fingerprint() -> str:
+    """Identify this parser build, so edits or a different Python invalidate the cache."""
+    st = os.stat(__file__)
+    return f"{st.st_mtime_ns}:{st.st_size}:{sys.version_info[0]}.{sys.version_info[1]}"
+
+
+def _cache_path(source: bytes) -> str:
+    """Cache entry for a file's source bytes, keyed by their SHA-256.
+    
+    Keying on content rather than path and mtime keeps entries valid across
+    touches, branch switches and fresh checkouts, and identical files share
+    one entry.
+    """
+    digest = hashlib.sha256(_parser_fingerprint().encode('utf-8'))
+    digest.update(source)
+    key = digest.hexdigest()
+    # Shard by prefix to keep directories small
+    return os.path.join(CACHE_DIR, key[:2], f"{key}.json")
+
+
+def _load_cached(cache_path: str) -> Optional[Dict[str, Any]]:
+    """Read a cached result, or None if it is missing or unreadable.
+    
+    A hit refreshes the entry's mtime, which prune_cache() uses as its
+    last-used time.
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            result = cast(Dict[str, Any], json.load(f))
+    except (OSError, ValueError):
+        return None
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return result
+
+
+def _store_cached(cache_path: str, result: Dict[str, Any]) -> None:
+    """Write a result to the cache atomically; failures (read-only home) are ignored."""
+    try:
+        data = json.dumps(result, separators=_COMPACT_SEPARATORS)
+    except (TypeError, ValueError):
+        # Not serializable: nothing to cache, the output path reports it
+        return
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    finally:
+        # Only still there if writing or renaming failed
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def prune_cache(max_bytes: int = CACHE_MAX_BYTES) -> None:
+    """Remove least recently used cache entries once the cache exceeds max_bytes.
+    
+    Entries are removed oldest first until the cache is down to three
+    quarters of max_bytes, so a full cache is not pruned again on every run.
+    Stray temp files from killed runs are counted and removed like entries.
+    Errors (concurrent pruning, read-only home) are ignored.
+    """
+    entries: List[Tuple[int, int, str]] = []
+    total = 0
+    try:
+        shards = [entry.path for entry in os.scandir(CACHE_DIR) if entry.is_dir()]
+    except OSError:
+        return
+    for shard in shards:
+        try:
+            with os.scandir(shard) as files:
+                for entry in files:
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime_ns, st.st_size, entry.path))
+                    total += st.st_size
+        except OSError:
+            continue
+    
+    if total <= max_bytes:
+        return
+    target = max_bytes * 3 // 4
+    entries.sort()
+    for _, size, path in entries:
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= target:
+            break
+
+
+def parse_files(file_paths: List[str], use_cache: bool = True) -> Iterator[Dict[str, Any]]:
+    """Parse files in input order, across worker processes for larger batches.
+    
+    Files are independent and parsing is CPU-bound, so batches are spread
+    over a process pool. Small batches, single-core machines and platforms
+    without working process pools are parsed serially.
+    """
+    parse = functools.partial(parse_file, use_cache=use_cache)
+    
+    workers = min(os.cpu_count() or 1, len(file_paths))
+    if sys.platform == 'win32':
+        workers = min(workers, _MAX_WINDOWS_WORKERS)
+    if len(file_paths) < PARALLEL_MIN_FILES or workers < 2:
+        yield from map(parse, file_paths)
+        return
+    
+    try:
+        # Imported here: concurrent.futures.process pulls in multiprocessing
+        # and logging, which single-file runs never need
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=workers)
+    except (ImportError, NotImplementedError, OSError, ValueError):
+        # e.g. no sem_open support (some sandboxes, Android), or a worker
+        # count the platform rejects
+        yield from map(parse, file_paths)
+        return
+    
+    # About four chunks per worker: few enough to amortize IPC, enough to
+    # balance uneven file sizes across workers
+    chunksize = max(1, len(file_paths) // (4 * workers))
+    with executor:
+        yield from executor.map(parse, file_paths, chunksize=chunksize)
+
+
+def write_results(results: Iterable[Dict[str, Any]], out: TextIO) -> None:
+    """Write results as {"files": [...]}, one file at a time.
+    
+    Streaming keeps memory bounded by a single file's result instead of
+    building the whole document before encoding it. The output is only
+    read by the TypeScript extractor, so it is compact (indent forces the
+    pure-Python encoder) and ASCII-only (safe for any stdout encoding and
+    for consumers that decode stdout chunk by chunk).
+    """
+    out.write('{"files":[')
+    for index, result in enumerate(results):
+        if index:
+            out.write(',')
+        out.write(json.dumps(result, separators=_COMPACT_SEPARATORS))
+    out.write(']}\n')
+
+
+# Server-mode results by (path, mtime_ns, size, use_cache), least recently
+# used first
+_PARSE_MEMO: 'OrderedDict[Tuple[str, int, int, bool], Dict[str, Any]]' = OrderedDict()
+_PARSE_MEMO_SIZE = 1024
+
+
+def _parse_file_memo(file_path: str, mtime_ns: int, size: int, use_cache: bool) -> Dict[str, Any]:
+    """parse_file() memoized in memory; mtime and size are part of the key so edits miss.
+    
+    Like the disk cache, results with a parseError are not kept: a file that
+    failed to read (permissions, transient I/O errors) is retried on the next
+    request even though its mtime and size did not change.
+    """
+    key = (file_path, mtime_ns, size, use_cache)
+    result = _PARSE_MEMO.get(key)
+    if result is not None:
+        _PARSE_MEMO.move_to_end(key)
+        return result
+    result = parse_file(file_path, use_cache=use_cache)
+    if 'parseError' not in result:
+        _PARSE_MEMO[key] = result
+        if len(_PARSE_MEMO) > _PARSE_MEMO_SIZE:
+            _PARSE_MEMO.popitem(last=False)
+    return result
+
+
+def serve(inp: TextIO, out: TextIO, use_cache: bool = True) -> None:
+    """Answer one file path per input line with one JSON result per output line.
+    
+    Long-lived callers (watchers, editors) keep a single process around
+    instead of paying interpreter startup per request; the docstring memo
+    and the loaded parser stay warm between requests, and files requested
+    again unchanged are answered from memory. Blank lines are ignored and
+    each result is flushed as soon as it is written. A request that fails
+    unexpectedly is answered with a parseError result, so one bad file
+    does not end the session.
+    """
+    for line in inp:
+        file_path = line.rstrip('\r\n')
+        if not file_path.strip():
+            continue
+        try:
+            response = json.dumps(_serve_result(file_path, use_cache), separators=_COMPACT_SEPARATORS)
+        except Exception as e:
+            response = json.dumps(_error_result(file_path, str(e)), separators=_COMPACT_SEPARATORS)
+        out.write(response)
+        out.write('\n')
+        out.flush()
+
+
+def _serve_result(file_path: str, use_cache: bool) -> Dict[str, Any]:
+    """Result for one server request, from the memo when the file is unchanged."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        # Let parse_file report the missing/unreadable file
+        return parse_file(file_path, use_cache=use_cache)
+    return _parse_file_memo(file_path, st.st_mtime_ns, st.st_size, use_cache)
+
+
 def main():
     """Main entry point."""
-    if len(sys.argv) < 2:
+    arg_parser = argparse.ArgumentParser(description='Extract architecture info from Python files.')
+    arg_parser.add_argument('files', nargs='*', help='Python files to parse')
+    arg_parser.add_argument('--no-cache', action='store_true',
+                            help=f'do not read or write the parse cache ({CACHE_DIR})')
+    arg_parser.add_argument('--server', action='store_true',
+                            help='read file paths from stdin, one per line, and write '
+                                 'one JSON result per line until stdin closes')
+    args = arg_parser.parse_args()
+    
+    if args.server:
+        if args.files:
+            arg_parser.error('file arguments cannot be combined with --server')
+        if not args.no_cache:
+            prune_cache()
+        serve(sys.stdin, sys.stdout, use_cache=not args.no_cache)
+        return
+    
+    if not args.files:
         print(json.dumps({'error': 'No file paths provided'}))
         sys.exit(1)
     
-    file_paths = sys.argv[1:]
-    results = {
-        'files': [parse_file(fp) for fp in file_paths]
-    }
-    
-    print(json.dumps(results, indent=2))
+    write_results(parse_files(args.files, use_cache=not args.no_cache), sys.stdout)
+    if not args.no_cache:
+        prune_cache()
 
 
 if __name__ == '__main__':
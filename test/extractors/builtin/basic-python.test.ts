@@ -2,13 +2,33 @@
  * Basic Python Extractor Tests
  */
 
-import { describe, it, expect } from 'vitest';
+import { describe, it, expect, beforeAll, afterAll } from 'vitest';
+import { rmSync } from 'node:fs';
+import { join } from 'node:path';
 import { basicPython } from '../../../src/extractors/builtin/basic-python.js';
 import type { ResolvedStageNode } from '../../../src/core/types-aac.js';
 import type { PipelineContext } from '../../../src/core/types.js';
 import { createLogger } from '../../../src/core/logger.js';
 
+// Parse cache for the spawned parser, kept out of the real home directory
+const CACHE_DIR = join(process.cwd(), 'test-tmp-python-cache');
+
 describe('basic-python extractor', () => {
+  const originalCacheDir = process.env.ARCHLETTE_PYTHON_CACHE_DIR;
+
+  beforeAll(() => {
+    process.env.ARCHLETTE_PYTHON_CACHE_DIR = CACHE_DIR;
+  });
+
+  afterAll(() => {
+    if (originalCacheDir === undefined) {
+      delete process.env.ARCHLETTE_PYTHON_CACHE_DIR;
+    } else {
+      process.env.ARCHLETTE_PYTHON_CACHE_DIR = originalCacheDir;
+    }
+    rmSync(CACHE_DIR, { recursive: true, force: true });
+  });
+
   // Create mock context for tests
   const mockContext: PipelineContext = {
     log: createLogger({ context: 'Test', level: 'error' }), // Minimal logging for tests
@@ -275,6 +295,11 @@ describe('basic-python extractor', () => {
     // Look for TypedDict, Protocol, and Enum in code items
     const codeItems = ir.code;
 
+    // NewTypes should be extracted
+    const userIdType = codeItems.find((item) => item.name === 'UserId');
+    expect(userIdType?.type).toBe('type');
+    expect(userIdType?.metadata?.typeCategory).toBe('NewType');
+
     // TypedDicts should be extracted
     const userProfileType = codeItems.find((item) => item.name === 'UserProfile');
     expect(userProfileType).toBeDefined();
@@ -286,6 +311,17 @@ describe('basic-python extractor', () => {
     const processorType = codeItems.find((item) => item.name === 'Processor');
     expect(processorType).toBeDefined();
 
+    const closeableType = codeItems.find(
+      (item) => item.name === 'Closeable' && item.type === 'type',
+    );
+    expect(closeableType?.metadata?.typeCategory).toBe('Protocol');
+
+    // A base class whose name merely contains 'Protocol' is not a Protocol
+    const handlerType = codeItems.find(
+      (item) => item.name === 'HttpProtocolHandler' && item.type === 'type',
+    );
+    expect(handlerType).toBeUndefined();
+
     // Enums should be extracted
     const paymentStatusType = codeItems.find((item) => item.name === 'PaymentStatus');
     expect(paymentStatusType).toBeDefined();
@@ -374,4 +410,38 @@ describe('basic-python extractor', () => {
     // The function should execute without errors
     expect(ir.code.length).toBeGreaterThan(0);
   });
+
+  it('should only extract module-level classes', async () => {
+    const node: ResolvedStageNode = {
+      use: 'extractors/builtin/basic-python',
+      name: 'nested-demo',
+      inputs: {
+        include: ['test/extractors/builtin/basic-python/fixtures/nested_classes.py'],
+        exclude: [],
+      },
+      props: {},
+      _effective: {
+        includes: ['test/extractors/builtin/basic-python/fixtures/nested_classes.py'],
+        excludes: [],
+      },
+    };
+
+    const ir = await basicPython(node, mockContext);
+
+    const classNames = ir.code
+      .filter((item) => item.type === 'class')
+      .map((item) => item.name);
+
+    // Top-level and conditionally defined module-level classes are extracted
+    expect(classNames).toContain('Outer');
+    expect(classNames).toContain('Registry');
+
+    // Classes nested in a class or function body are not
+    expect(classNames).not.toContain('Inner');
+    expect(classNames).not.toContain('LocalOnly');
+
+    // Members of the outer class are still extracted
+    const method = ir.code.find((item) => item.name === 'Outer.method');
+    expect(method).toBeDefined();
+  });
 });
@@ -0,0 +1,287 @@
+/**
+ * Unit tests for the basic-python parser script and its TypeScript wrapper
+ */
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import {
+  chmodSync,
+  existsSync,
+  mkdirSync,
+  readdirSync,
+  rmSync,
+  utimesSync,
+  writeFileSync,
+} from 'node:fs';
+import { join } from 'node:path';
+
+// Spy on spawn to check the arguments the parser script is started with
+vi.mock('child_process', async (importOriginal) => {
+  const actual = await importOriginal<typeof import('child_process')>();
+  return {
+    ...actual,
+    spawn: vi.fn(actual.spawn),
+  };
+});
+
+// Import after mocking
+import { spawn } from 'child_process';
+import { parseFiles } from '../../../../src/extractors/builtin/basic-python/file-parser.js';
+
+const TEST_DIR = join(process.cwd(), 'test-tmp-python-parser');
+// Parse cache for spawned parsers, kept out of the real home directory
+const CACHE_DIR = join(TEST_DIR, 'cache');
+const PARSER_SCRIPT = join(process.cwd(), 'src', 'scripts', 'python-ast-parser.py');
+const FIXTURES = 'test/extractors/builtin/basic-python/fixtures';
+
+/**
+ * Restore an environment variable saved before a test
+ */
+function restoreEnv(name: string, value: string | undefined): void {
+  if (value === undefined) {
+    delete process.env[name];
+  } else {
+    process.env[name] = value;
+  }
+}
+
+/**
+ * Run the parser script in --server mode, feed it input on stdin and
+ * return the JSON results, one per output line
+ */
+function runServer(input: string): Promise<any[]> {
+  return new Promise((resolve, reject) => {
+    const child = spawn('python', [PARSER_SCRIPT, '--server', '--no-cache']);
+    let stdout = '';
+    let stderr = '';
+    child.stdout.on('data', (data) => {
+      stdout += data.toString();
+    });
+    child.stderr.on('data', (data) => {
+      stderr += data.toString();
+    });
+    child.on('error', reject);
+    child.on('close', (code) => {
+      if (code !== 0) {
+        reject(new Error(`Parser server exited with code ${code}:\n${stderr}`));
+        return;
+      }
+      resolve(
+        stdout
+          .split('\n')
+          .filter((line) => line.trim())
+          .map((line) => JSON.parse(line)),
+      );
+    });
+    child.stdin.end(input);
+  });
+}
+
+/**
+ * Start the parser script in --server mode for a conversation: request()
+ * sends one path and resolves with the result line that answers it
+ */
+function startServer() {
+  const child = spawn('python', [PARSER_SCRIPT, '--server', '--no-cache']);
+  const pending: Array<(result: any) => void> = [];
+  let buffer = '';
+  child.stdout.on('data', (data) => {
+    buffer += data.toString();
+    let newline = buffer.indexOf('\n');
+    while (newline >= 0) {
+      const line = buffer.slice(0, newline);
+      buffer = buffer.slice(newline + 1);
+      pending.shift()?.(JSON.parse(line));
+      newline = buffer.indexOf('\n');
+    }
+  });
+
+  return {
+    request: (filePath: string): Promise<any> =>
+      new Promise((resolve) => {
+        pending.push(resolve);
+        child.stdin.write(`${filePath}\n`);
+      }),
+    close: (): Promise<void> =>
+      new Promise((resolve) => {
+        child.on('close', () => resolve());
+        child.stdin.end();
+      }),
+  };
+}
+
+/**
+ * Write a file with a fixed whole-second mtime, so a rewrite can keep the
+ * exact mtime the server's memo is keyed on
+ */
+function writeWithFixedMtime(filePath: string, content: string): void {
+  writeFileSync(filePath, content);
+  utimesSync(filePath, 1700000000, 1700000000);
+}
+
+/**
+ * Count parse cache entries (sharded as <2-char prefix>/<key>.json)
+ */
+function countCacheEntries(): number {
+  if (!existsSync(CACHE_DIR)) {
+    return 0;
+  }
+  return readdirSync(CACHE_DIR).reduce(
+    (count, shard) =>
+      count +
+      readdirSync(join(CACHE_DIR, shard)).filter((name) => name.endsWith('.json'))
+        .length,
+    0,
+  );
+}
+
+describe('basic-python file-parser', () => {
+  const originalCacheDir = process.env.ARCHLETTE_PYTHON_CACHE_DIR;
+
+  beforeEach(() => {
+    mkdirSync(TEST_DIR, { recursive: true });
+    // Spawned parsers inherit the environment
+    process.env.ARCHLETTE_PYTHON_CACHE_DIR = CACHE_DIR;
+  });
+
+  afterEach(() => {
+    restoreEnv('ARCHLETTE_PYTHON_CACHE_DIR', originalCacheDir);
+    rmSync(TEST_DIR, { recursive: true, force: true });
+    vi.mocked(spawn).mockClear();
+  });
+
+  describe('parseFiles', () => {
+    const fixtureFiles = readdirSync(FIXTURES)
+      .filter((name) => name.endsWith('.py'))
+      .sort()
+      .map((name) => `${FIXTURES}/${name}`);
+
+    /** Arguments of the most recent parser script spawn */
+    const lastSpawnArgs = () => vi.mocked(spawn).mock.lastCall?.[1] ?? [];
+
+    it('should pass --no-cache when the cache is disabled', async () => {
+      await parseFiles([`${FIXTURES}/simple.py`], 'python', { cache: false });
+
+      expect(lastSpawnArgs()).toContain('--no-cache');
+    });
+
+    it('should use the cache by default', async () => {
+      await parseFiles([`${FIXTURES}/simple.py`], 'python');
+
+      expect(lastSpawnArgs()).not.toContain('--no-cache');
+    });
+
+    it('should return the same results with and without the cache', async () => {
+      const uncached = await parseFiles(fixtureFiles, 'python', { cache: false });
+      expect(countCacheEntries()).toBe(0);
+
+      // First cached run fills the cache, the second is served from it
+      await parseFiles(fixtureFiles, 'python', { cache: true });
+      expect(countCacheEntries()).toBe(fixtureFiles.length);
+      const cached = await parseFiles(fixtureFiles, 'python', { cache: true });
+
+      expect(cached).toEqual(uncached);
+    });
+
+    it('should return batch results in input order', async () => {
+      // At least PARALLEL_MIN_FILES (8) files: parsed in a process pool on
+      // multi-core machines
+      expect(fixtureFiles.length).toBeGreaterThanOrEqual(8);
+      const batch = await parseFiles(fixtureFiles, 'python', { cache: false });
+      const single = await Promise.all(
+        fixtureFiles.map((file) => parseFiles([file], 'python', { cache: false })),
+      );
+
+      expect(batch.map((file) => file.filePath)).toEqual(fixtureFiles);
+      expect(batch).toEqual(single.flat());
+    });
+  });
+
+  describe('python-ast-parser.py --server', () => {
+    it('should answer each path with one result line, in order', async () => {
+      const results = await runServer(
+        `${FIXTURES}/simple.py\n\n${FIXTURES}/imports.py\n`,
+      );
+
+      expect(results).toHaveLength(2);
+      expect(results[0].filePath).toBe(`${FIXTURES}/simple.py`);
+      expect(results[0].component.name).toBe('Utils');
+      expect(results[1].filePath).toBe(`${FIXTURES}/imports.py`);
+      expect(results[1].imports.length).toBeGreaterThan(0);
+    });
+
+    it('should keep answering after a file fails', async () => {
+      const missing = join(TEST_DIR, 'missing.py');
+      const results = await runServer(`${missing}\n${FIXTURES}/simple.py\n`);
+
+      expect(results).toHaveLength(2);
+      expect(results[0].filePath).toBe(missing);
+      expect(results[0].parseError).toBeDefined();
+      expect(results[1].parseError).toBeUndefined();
+      expect(results[1].component.name).toBe('Utils');
+    });
+
+    it('should answer unchanged files from memory and reparse edited ones', async () => {
+      const filePath = join(TEST_DIR, 'memo.py');
+      const server = startServer();
+      try {
+        writeWithFixedMtime(filePath, '"""@module Alpha"""\n');
+        expect((await server.request(filePath)).component.name).toBe('Alpha');
+
+        // Same size and mtime: the memoized result is reused
+        writeWithFixedMtime(filePath, '"""@module Bravo"""\n');
+        expect((await server.request(filePath)).component.name).toBe('Alpha');
+
+        // Size changed: the memo misses and the file is parsed again
+        writeWithFixedMtime(filePath, '"""@module Charlie2"""\n');
+        expect((await server.request(filePath)).component.name).toBe('Charlie2');
+      } finally {
+        await server.close();
+      }
+    });
+
+    // chmod 000 does not stop root from reading, and Windows ignores it
+    it.skipIf(process.platform === 'win32' || process.getuid?.() === 0)(
+      'should retry a file that could not be read once it is readable',
+      async () => {
+        const filePath = join(TEST_DIR, 'locked.py');
+        writeWithFixedMtime(filePath, '"""@module Locked"""\n');
+        chmodSync(filePath, 0o000);
+        const server = startServer();
+        try {
+          expect((await server.request(filePath)).parseError).toBeDefined();
+
+          // chmod changes neither mtime nor size, so the memo key is the same
+          chmodSync(filePath, 0o644);
+          const result = await server.request(filePath);
+          expect(result.parseError).toBeUndefined();
+          expect(result.component.name).toBe('Locked');
+        } finally {
+          await server.close();
+        }
+      },
+    );
+
+    it('should report non-JSON decorator arguments as source text', async () => {
+      const filePath = join(TEST_DIR, 'deco.py');
+      writeFileSync(
+        filePath,
+        [
+          'def register(*args, **kwargs):',
+          '    return lambda f: f',
+          '',
+          "@register(b'key', ..., name='handler')",
+          'def handler():',
+          '    """Handle requests."""',
+          '',
+        ].join('\n'),
+      );
+
+      const results = await runServer(`${filePath}\n${FIXTURES}/simple.py\n`);
+
+      expect(results).toHaveLength(2);
+      expect(results[0].parseError).toBeUndefined();
+      const handler = results[0].functions.find((f: any) => f.name === 'handler');
+      expect(handler.decoratorDetails[0].args).toEqual(["b'key'", '...']);
+      expect(handler.decoratorDetails[0].kwargs).toEqual({ name: 'handler' });
+    });
+  });
+});
@@ -9,22 +9,18 @@ Contains examples of stdlib, third-party, and local imports.
 # pyright: reportUnusedImport=false
 # All imports intentionally unused - this is a test fixture for import categorization
 
-# Standard library imports
-import os
-import sys
-import json
+# Standard library imports (one statement may import several modules)
+import os, sys, json, datetime
 from pathlib import Path
 from typing import Dict, List
 from collections import defaultdict
-import datetime
 from dataclasses import dataclass
 
 # Third-party imports (examples - won't actually be installed)
-import requests  # type: ignore[import-not-found, import-untyped]
+import requests, pytest  # type: ignore[import-not-found, import-untyped]
 import numpy as np  # type: ignore[import-not-found]
 from flask import Flask, request  # type: ignore[import-not-found]
 from django.db import models  # type: ignore[import-not-found]
-import pytest  # type: ignore[import-not-found]
 
 # Local relative imports (will fail - no parent module, but tests import extraction)
 # Wrapped in try/except to avoid runtime errors during direct execution
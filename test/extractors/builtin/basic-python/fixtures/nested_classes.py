@@ -0,0 +1,39 @@
+"""
+Test fixture for top-level class extraction.
+Nested classes must not be reported as module-level code.
+
+@component NestedDemo
+"""
+
+try:
+    from collections import OrderedDict
+except ImportError:
+    OrderedDict = dict
+
+
+class Outer:
+    """Top-level class with a nested helper class."""
+
+    class Inner:
+        """Nested class (not module-level)."""
+
+        def helper(self) -> None:
+            pass
+
+    def method(self) -> None:
+        """Regular method."""
+        pass
+
+
+def build():
+    """Function that defines a local class."""
+
+    class LocalOnly:
+        pass
+
+    return LocalOnly
+
+
+if OrderedDict is not None:
+    class Registry(OrderedDict):
+        """Registry defined conditionally at module level."""
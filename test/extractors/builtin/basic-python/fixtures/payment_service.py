@@ -18,8 +18,11 @@ This module handles payment transactions and refunds.
 from typing import Optional
 from dataclasses import dataclass
 
+# Luhn doubling of an ASCII digit, folded back to one digit (7 -> 14 -> 5)
+_LUHN_DOUBLED = bytes.maketrans(b'0123456789', b'0246813579')
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PaymentRequest:
     """Payment request data.
     
@@ -86,8 +89,14 @@ class PaymentProcessor:
         Returns:
             True if valid, False otherwise
         """
-        # Implementation here
-        return True
+        digits = card_number.replace(' ', '')
+        if len(digits) < 2 or not (digits.isascii() and digits.isdigit()):
+            return False
+        raw = digits.encode('ascii')
+        # Every second digit from the right is doubled via the table, so the
+        # checksum is two byte sums with no per-digit branch.
+        total = sum(raw[-1::-2]) + sum(raw[-2::-2].translate(_LUHN_DOUBLED))
+        return (total - 48 * len(raw)) % 10 == 0
 
 
 def format_amount(cents: int, currency: str = 'USD') -> str:
@@ -100,8 +109,9 @@ def format_amount(cents: int, currency: str = 'USD') -> str:
     Returns:
         Formatted amount string (e.g., "$12.34")
     """
-    dollars = cents / 100
-    return f"${dollars:.2f}"
+    sign = '-' if cents < 0 else ''
+    dollars, remainder = divmod(abs(cents), 100)
+    return f"{sign}${dollars}.{remainder:02d}"
 
 
 async def send_receipt(customer_email: str, transaction_id: str) -> None:
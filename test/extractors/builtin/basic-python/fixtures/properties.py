@@ -6,6 +6,7 @@ Demonstrates various property patterns in Python.
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 
@@ -91,7 +92,7 @@ class User:
         self._login_count = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Product:
     """Product with dataclass fields.
     
@@ -138,6 +139,7 @@ class Rectangle:
         if value <= 0:
             raise ValueError("Width must be positive")
         self._width = value
+        self._invalidate_dimensions()
     
     @property
     def height(self) -> float:
@@ -150,8 +152,14 @@ class Rectangle:
         if value <= 0:
             raise ValueError("Height must be positive")
         self._height = value
+        self._invalidate_dimensions()
     
-    @property
+    def _invalidate_dimensions(self) -> None:
+        """Drop cached values derived from width and height."""
+        self.__dict__.pop('area', None)
+        self.__dict__.pop('perimeter', None)
+    
+    @cached_property
     def area(self) -> float:
         """Rectangle area (read-only).
         
@@ -160,7 +168,7 @@ class Rectangle:
         """
         return self._width * self._height
     
-    @property
+    @cached_property
     def perimeter(self) -> float:
         """Rectangle perimeter (read-only).
         
@@ -5,6 +5,7 @@ Demonstrates Python type definitions including TypeAlias, TypedDict, Protocol, E
 @module TypeDefinitions
 """
 
+import typing
 from typing import TypedDict, Protocol, NewType, TypeAlias, Optional, Dict, List
 from enum import Enum, IntEnum, auto
 
@@ -72,6 +73,23 @@ class Validator(Protocol):
         ...
 
 
+class Closeable(typing.Protocol):
+    """Protocol referenced through the typing module."""
+    
+    def close(self) -> None:
+        """Release resources."""
+        ...
+
+
+# Not a Protocol: the base class name merely contains 'Protocol'
+class ProtocolHandlerBase:
+    """Base class for wire protocol handlers."""
+
+
+class HttpProtocolHandler(ProtocolHandlerBase):
+    """HTTP wire protocol handler."""
+
+
 # Enum definitions
 class PaymentStatus(Enum):
     """Payment status enumeration.